@@ -1,133 +1,343 @@
 import pickle
 import os
-from collections import UserDict
-from datetime import datetime, timedelta
+import sys
+from bisect import bisect_left, bisect_right
+from calendar import isleap
+from datetime import date, datetime
 from abc import ABC, abstractmethod
 
+try:
+    import msgpack
+except ImportError:  # без msgpack зберігаємо дані через pickle
+    msgpack = None
+
+
+# ==================== Pickle Helpers ====================
+def restore_slots(obj, state):
+    """Відновлює стан об'єкта з __slots__, зокрема зі старих pickle-файлів з __dict__"""
+    if isinstance(state, tuple):
+        state = state[1]
+    for key, value in state.items():
+        setattr(obj, key, value)
+
 
 # ==================== Field Classes ====================
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __setstate__(self, state):
+        restore_slots(self, state)
+
     def __str__(self):
         return str(self.value)
 
 
 class Name(Field):
-    pass
+    __slots__ = ()
+
+    def __init__(self, value):
+        super().__init__(sys.intern(value))
+
+    def __setstate__(self, state):
+        # Після розпакування рядки вже не інтерновані
+        super().__setstate__(state)
+        self.value = sys.intern(self.value)
 
 
 class Phone(Field):
+    __slots__ = ()
+    _DIGITS = b"0123456789"
+
     def __init__(self, value):
         if not self.validate(value):
             raise ValueError("Phone number must contain exactly 10 digits")
-        super().__init__(value)
+        super().__init__(sys.intern(value))
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.value = sys.intern(self.value)
+
+    @classmethod
+    def from_trusted(cls, value):
+        """Створює телефон без перевірки — для даних, збережених самим ботом"""
+        phone = cls.__new__(cls)
+        Field.__init__(phone, sys.intern(value))
+        return phone
 
     @staticmethod
     def validate(value):
-        return value.isdigit() and len(value) == 10
+        # Лише ASCII-цифри: isdigit() пропускає й інші Unicode-цифри
+        return (
+            len(value) == 10
+            and value.isascii()
+            and not value.encode("ascii").translate(None, Phone._DIGITS)
+        )
 
 
 class Birthday(Field):
+    __slots__ = ("date",)
+
     def __init__(self, value):
         try:
-            datetime.strptime(value, "%d.%m.%Y")
+            self.date = datetime.strptime(value, "%d.%m.%Y").date()
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
         super().__init__(value)
 
+    def __setstate__(self, state):
+        # Старі pickle-файли не містять розібраної дати
+        super().__setstate__(state)
+        if not hasattr(self, "date"):
+            self.date = datetime.strptime(self.value, "%d.%m.%Y").date()
+
 
 # ==================== Record and AddressBook ====================
+# Зсув привітання на понеділок: субота +2 дні, неділя +1 день
+WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
+
+
 class Record:
+    __slots__ = ("name", "phones", "birthday")
+
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        self.phones = {}
         self.birthday = None
 
+    def __setstate__(self, state):
+        restore_slots(self, state)
+        # Старі pickle-файли зберігали телефони списком
+        if isinstance(self.phones, list):
+            self.phones = {p.value: p for p in self.phones}
+
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        phone_obj = Phone(phone)
+        self.phones[phone_obj.value] = phone_obj
 
     def remove_phone(self, phone):
-        phone_obj = self.find_phone(phone)
-        if phone_obj:
-            self.phones.remove(phone_obj)
-        else:
+        if self.phones.pop(phone, None) is None:
             raise ValueError(f"Phone {phone} not found")
 
     def edit_phone(self, old_phone, new_phone):
-        phone_obj = self.find_phone(old_phone)
-        if not phone_obj:
+        if old_phone not in self.phones:
             raise ValueError(f"Phone {old_phone} not found")
 
         if not Phone.validate(new_phone):
             raise ValueError("New phone number must contain exactly 10 digits")
 
-        self.phones.remove(phone_obj)
-        self.phones.append(Phone(new_phone))
+        del self.phones[old_phone]
+        self.add_phone(new_phone)
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return self.phones.get(phone)
 
     def add_birthday(self, birthday):
+        """Задає день народження запису, ще не доданого до книги.
+
+        Для контактів у книзі використовуйте AddressBook.add_birthday,
+        інакше індекс днів народження не оновиться.
+        """
         self.birthday = Birthday(birthday)
 
+    def to_dict(self):
+        return {
+            "name": self.name.value,
+            "phones": list(self.phones),
+            "birthday": self.birthday.value if self.birthday else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls(data["name"])
+        # Номери вже перевірені під час додавання; старі записи могли пройти
+        # м'якшу перевірку, тому не відхиляємо їх під час завантаження
+        for phone in data["phones"]:
+            phone_obj = Phone.from_trusted(phone)
+            record.phones[phone_obj.value] = phone_obj
+        if data["birthday"]:
+            record.add_birthday(data["birthday"])
+        return record
+
     def __str__(self):
-        phones_str = '; '.join(p.value for p in self.phones)
+        phones_str = '; '.join(self.phones)
         birthday_str = f", birthday: {self.birthday}" if self.birthday else ""
         return f"Contact name: {self.name.value}, phones: {phones_str}{birthday_str}"
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Відсортований індекс днів народження: ключі month * 100 + day
+        # та паралельний список імен
+        self._rebuild_birthday_index()
+
+    def __reduce__(self):
+        # Відновлюємо книгу через __init__, щоб індекс будувався один раз
+        return self.__class__, (dict(self),)
+
+    def __setstate__(self, state):
+        # Старі pickle-файли (UserDict) зберігали контакти в атрибуті data
+        legacy_data = state.pop("data", None)
+        if legacy_data is not None:
+            super().update(legacy_data)
+        self.__dict__.update(state)
+        self._rebuild_birthday_index()
+
+    # Усі зміни словника мають оновлювати індекс днів народження
+    def __setitem__(self, name, record):
+        old_record = self.get(name)
+        if old_record is not None:
+            self._unindex_birthday(name, old_record)
+        super().__setitem__(name, record)
+        self._index_birthday(name, record)
+
+    def __delitem__(self, name):
+        record = self[name]
+        super().__delitem__(name)
+        self._unindex_birthday(name, record)
+
+    def pop(self, name, *default):
+        if name not in self:
+            return super().pop(name, *default)
+        record = super().pop(name)
+        self._unindex_birthday(name, record)
+        return record
+
+    def popitem(self):
+        name, record = super().popitem()
+        self._unindex_birthday(name, record)
+        return name, record
+
+    def setdefault(self, name, record=None):
+        if name not in self:
+            self[name] = record
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._rebuild_birthday_index()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._rebuild_birthday_index()
+
+    def copy(self):
+        return self.__class__(self)
+
+    @staticmethod
+    def _md_key(day):
+        return day.month * 100 + day.day
+
+    def _rebuild_birthday_index(self):
+        entries = sorted(
+            (self._md_key(record.birthday.date), name)
+            for name, record in self.items()
+            if record.birthday is not None
+        )
+        self._bday_md = [key for key, _ in entries]
+        self._bday_names = [name for _, name in entries]
+
+    def _index_birthday(self, name, record):
+        if record.birthday is not None:
+            key = self._md_key(record.birthday.date)
+            position = bisect_right(self._bday_md, key)
+            self._bday_md.insert(position, key)
+            self._bday_names.insert(position, name)
+
+    def _unindex_birthday(self, name, record):
+        if record.birthday is None:
+            return
+        # Шукаємо лише серед записів з тим самим ключем дня народження
+        key = self._md_key(record.birthday.date)
+        first = bisect_left(self._bday_md, key)
+        last = bisect_right(self._bday_md, key)
+        for position in range(first, last):
+            if self._bday_names[position] == name:
+                del self._bday_md[position]
+                del self._bday_names[position]
+                return
+
     def add_record(self, record):
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name):
-        return self.data.get(name)
+        return self.get(sys.intern(name))
 
     def delete(self, name):
-        if name in self.data:
-            del self.data[name]
+        name = sys.intern(name)
+        if name in self:
+            del self[name]
         else:
             raise KeyError(f"Contact {name} not found")
 
+    def add_birthday(self, record, birthday):
+        """Додає день народження контакту з цієї книги та оновлює індекс"""
+        # Спершу перевіряємо дату, щоб невдала спроба не зіпсувала індекс
+        new_birthday = Birthday(birthday)
+        self._unindex_birthday(record.name.value, record)
+        record.birthday = new_birthday
+        self._index_birthday(record.name.value, record)
+
+    @staticmethod
+    def _birthday_ordinal(birthday_date, year):
+        try:
+            return birthday_date.replace(year=year).toordinal()
+        except ValueError:  # 29 лютого у невисокосний рік святкуємо 1 березня
+            return date(year, 3, 1).toordinal()
+
     def get_upcoming_birthdays(self):
         today = datetime.today().date()
-        upcoming = []
+        year = today.year
+        today_ordinal = today.toordinal()
+        today_weekday = today.weekday()
+        window_end = date.fromordinal(today_ordinal + 7)
+        start_key = self._md_key(today)
+        end_key = self._md_key(window_end)
+
+        # 1 березня невисокосного року також належить іменинникам 29 лютого
+        if start_key == 301 and not isleap(year):
+            start_key = 229
+
+        # Вікно може переходити через кінець року — тоді шукаємо двома відрізками
+        if start_key <= end_key:
+            windows = [(start_key, end_key)]
+        else:
+            windows = [(start_key, 1231), (101, end_key)]
 
-        for record in self.data.values():
-            if record.birthday is None:
-                continue
+        upcoming = []
 
-            birthday_date = datetime.strptime(record.birthday.value, "%d.%m.%Y").date()
-            birthday_this_year = birthday_date.replace(year=today.year)
+        for low, high in windows:
+            first = bisect_left(self._bday_md, low)
+            last = bisect_right(self._bday_md, high)
 
-            if birthday_this_year < today:
-                birthday_this_year = birthday_date.replace(year=today.year + 1)
+            for name in self._bday_names[first:last]:
+                birthday_date = self[name].birthday.date
+                birthday_ordinal = self._birthday_ordinal(birthday_date, year)
 
-            days_until_birthday = (birthday_this_year - today).days
+                if birthday_ordinal < today_ordinal:
+                    birthday_ordinal = self._birthday_ordinal(birthday_date, year + 1)
 
-            if 0 <= days_until_birthday <= 7:
-                congratulation_date = birthday_this_year
-                if birthday_this_year.weekday() == 5:  # Субота
-                    congratulation_date += timedelta(days=2)
-                elif birthday_this_year.weekday() == 6:  # Неділя
-                    congratulation_date += timedelta(days=1)
+                weekday = (today_weekday + birthday_ordinal - today_ordinal) % 7
+                birthday_ordinal += WEEKEND_SHIFT[weekday]
 
                 upcoming.append({
-                    "name": record.name.value,
-                    "birthday": congratulation_date.strftime("%d.%m.%Y")
+                    "name": name,
+                    "birthday": date.fromordinal(birthday_ordinal).strftime("%d.%m.%Y")
                 })
 
         return upcoming
 
     def __str__(self):
-        if not self.data:
+        if not self:
             return "Address book is empty"
-        return "\n".join(str(record) for record in self.data.values())
+        return "\n".join(str(record) for record in self.values())
 
 
 # ==================== View Layer (Abstract Base Class) ====================
@@ -175,6 +385,45 @@ class BaseView(ABC):
         pass
 
 
+# ==================== Static Console Texts ====================
+_HELP_ENTRIES = [
+    ("hello", "greet the bot"),
+    ("add [name] [phone]", "add contact or phone"),
+    ("change [name] [old_phone] [new_phone]", "change phone"),
+    ("phone [name]", "show contact phones"),
+    ("all", "show all contacts"),
+    ("add-birthday [name] [DD.MM.YYYY]", "add birthday"),
+    ("show-birthday [name]", "show birthday"),
+    ("birthdays", "show upcoming birthdays (next 7 days)"),
+    ("delete [name]", "delete contact"),
+    ("remove [name] [phone]", "remove specific phone"),
+    ("close/exit", "exit the bot"),
+]
+
+# Текст не змінюється, тому форматуємо його один раз під час імпорту
+_COMMANDS_TEXT = "\n".join([
+    "\n" + "=" * 50,
+    "AVAILABLE COMMANDS",
+    "=" * 50,
+    *[f"  {cmd:<40} - {description}" for cmd, description in _HELP_ENTRIES],
+    "=" * 50,
+]) + "\n"
+
+_WELCOME_TEXT = "\n".join([
+    "\n" + "=" * 50,
+    "WELCOME TO THE ASSISTANT BOT!",
+    "=" * 50,
+    "Type 'help' to see available commands",
+    "=" * 50,
+]) + "\n"
+
+_GOODBYE_TEXT = "\n".join([
+    "\n" + "=" * 50,
+    "Good bye! Have a great day!",
+    "=" * 50,
+]) + "\n"
+
+
 # ==================== Console View Implementation ====================
 class ConsoleView(BaseView):
     """Конкретна реалізація для консольного інтерфейсу"""
@@ -183,87 +432,110 @@ class ConsoleView(BaseView):
         print(message)
 
     def show_contacts(self, book: AddressBook):
-        if not book.data:
+        if not book:
             print("No contacts saved.")
             return
 
-        print("\n" + "=" * 50)
-        print("ALL CONTACTS")
-        print("=" * 50)
-        for record in book.data.values():
-            self.show_contact(record)
-            print("-" * 50)
+        lines = ["\n" + "=" * 50, "ALL CONTACTS", "=" * 50]
+        for record in book.values():
+            lines.extend(self._contact_lines(record))
+            lines.append("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_contact(self, record: Record):
-        phones_str = '; '.join(p.value for p in record.phones) if record.phones else "No phones"
-        birthday_str = f"Birthday: {record.birthday}" if record.birthday else "No birthday set"
+        sys.stdout.write("\n".join(self._contact_lines(record)) + "\n")
 
-        print(f"Name: {record.name.value}")
-        print(f"Phones: {phones_str}")
-        print(f"{birthday_str}")
+    @staticmethod
+    def _contact_lines(record: Record):
+        phones_str = '; '.join(record.phones) if record.phones else "No phones"
+        birthday_str = f"Birthday: {record.birthday}" if record.birthday else "No birthday set"
 
-    def show_commands(self):
-        commands = [
-            ("hello", "greet the bot"),
-            ("add [name] [phone]", "add contact or phone"),
-            ("change [name] [old_phone] [new_phone]", "change phone"),
-            ("phone [name]", "show contact phones"),
-            ("all", "show all contacts"),
-            ("add-birthday [name] [DD.MM.YYYY]", "add birthday"),
-            ("show-birthday [name]", "show birthday"),
-            ("birthdays", "show upcoming birthdays (next 7 days)"),
-            ("delete [name]", "delete contact"),
-            ("remove [name] [phone]", "remove specific phone"),
-            ("close/exit", "exit the bot"),
+        return [
+            f"Name: {record.name.value}",
+            f"Phones: {phones_str}",
+            f"{birthday_str}",
         ]
 
-        print("\n" + "=" * 50)
-        print("AVAILABLE COMMANDS")
-        print("=" * 50)
-        for cmd, description in commands:
-            print(f"  {cmd:<40} - {description}")
-        print("=" * 50)
+    def show_commands(self):
+        sys.stdout.write(_COMMANDS_TEXT)
 
     def show_birthdays(self, birthdays: list):
         if not birthdays:
             print("No upcoming birthdays in the next 7 days.")
             return
 
-        print("\n" + "=" * 50)
-        print("UPCOMING BIRTHDAYS")
-        print("=" * 50)
+        lines = ["\n" + "=" * 50, "UPCOMING BIRTHDAYS", "=" * 50]
         for item in birthdays:
-            print(f"  {item['name']:<20} : {item['birthday']}")
-        print("=" * 50)
+            lines.append(f"  {item['name']:<20} : {item['birthday']}")
+        lines.append("=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_input(self, prompt: str = ">>> ") -> str:
         return input(f"\n{prompt}")
 
     def show_welcome(self):
-        print("\n" + "=" * 50)
-        print("WELCOME TO THE ASSISTANT BOT!")
-        print("=" * 50)
-        print("Type 'help' to see available commands")
-        print("=" * 50)
+        sys.stdout.write(_WELCOME_TEXT)
 
     def show_goodbye(self):
-        print("\n" + "=" * 50)
-        print("Good bye! Have a great day!")
-        print("=" * 50)
+        sys.stdout.write(_GOODBYE_TEXT)
 
 
 # ==================== Data Persistence ====================
-def save_data(book, filename="addressbook.pkl"):
-    """Зберігає адресну книгу у файл за допомогою pickle"""
+DATA_FILE = "addressbook.msgpack"
+LEGACY_DATA_FILE = "addressbook.pkl"
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def save_data(book, filename=DATA_FILE, legacy_filename=LEGACY_DATA_FILE):
+    """Зберігає адресну книгу у файл msgpack (або pickle, якщо msgpack не встановлено)"""
+    if msgpack is None:
+        with open(legacy_filename, "wb", buffering=IO_BUFFER_SIZE) as f:
+            pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(book)
+        return
+
+    records = [record.to_dict() for record in book.values()]
     with open(filename, "wb") as f:
-        pickle.dump(book, f)
+        f.write(msgpack.packb(records, use_bin_type=True))
+
+    # Дані перенесено у msgpack — старий pickle-файл більше не потрібен
+    try:
+        os.remove(legacy_filename)
+    except FileNotFoundError:
+        pass
 
 
-def load_data(filename="addressbook.pkl"):
-    """Завантажує адресну книгу з файлу, або створює нову, якщо файл не знайдено"""
+def _modified_time(filename):
     try:
+        return os.path.getmtime(filename)
+    except OSError:
+        return None
+
+
+def load_data(filename=DATA_FILE, legacy_filename=LEGACY_DATA_FILE):
+    """Завантажує адресну книгу з новішого файлу, або створює нову, якщо файлів немає"""
+    # Pickle-файл може бути новішим, якщо бот запускали без msgpack
+    msgpack_time = _modified_time(filename)
+    legacy_time = _modified_time(legacy_filename)
+    use_msgpack = (
+        msgpack is not None
+        and msgpack_time is not None
+        and (legacy_time is None or msgpack_time >= legacy_time)
+    )
+
+    if use_msgpack:
         with open(filename, "rb") as f:
-            return pickle.load(f)
+            records = msgpack.unpackb(f.read(), raw=False)
+        # Будуємо книгу одним викликом, щоб індекс днів народження
+        # відсортувався один раз, а не вставкою на кожен запис
+        return AddressBook(
+            (record.name.value, record)
+            for record in map(Record.from_dict, records)
+        )
+
+    # Сумісність зі старими файлами pickle
+    try:
+        with open(legacy_filename, "rb", buffering=IO_BUFFER_SIZE) as f:
+            return pickle.Unpickler(f).load()
     except FileNotFoundError:
         return AddressBook()
 
@@ -279,20 +551,20 @@ def parse_input(user_input: str):
 
 
 # ==================== Error Handling Decorator ====================
+NOT_ENOUGH_ARGS = "Not enough arguments. Please try again."
+CONTACT_NOT_FOUND = "This contact does not exist."
+
+
 def input_error(func):
+    # Кількість аргументів і наявність контакту перевіряють самі обробники,
+    # тут лишаються лише помилки валідації даних
     def wrapper(args, book, view):
         try:
             return func(args, book, view)
         except ValueError as e:
             return f"Error: {e}"
-        except IndexError:
-            return "Not enough arguments. Please try again."
         except KeyError as e:
-            return f"Error: {e}" if str(e) else "This contact does not exist."
-        except AttributeError:
-            return "This contact does not exist."
-        except Exception as e:
-            return f"Unexpected error: {e}"
+            return f"Error: {e}" if str(e) else CONTACT_NOT_FOUND
 
     return wrapper
 
@@ -300,7 +572,9 @@ def input_error(func):
 # ==================== Command Handlers ====================
 @input_error
 def add_contact(args, book, view):
-    name, phone, *_ = args
+    if len(args) < 2:
+        return NOT_ENOUGH_ARGS
+    name, phone = args[0], args[1]
     record = book.find(name)
     message = "Contact updated."
 
@@ -317,21 +591,29 @@ def add_contact(args, book, view):
 
 @input_error
 def change_contact(args, book, view):
-    name, old_phone, new_phone = args
+    if len(args) < 3:
+        return NOT_ENOUGH_ARGS
+    name, old_phone, new_phone = args[0], args[1], args[2]
     record = book.find(name)
+    if record is None:
+        return CONTACT_NOT_FOUND
     record.edit_phone(old_phone, new_phone)
     return f"Phone updated for {name}."
 
 
 @input_error
 def show_phone(args, book, view):
-    name, *_ = args
+    if not args:
+        return NOT_ENOUGH_ARGS
+    name = args[0]
     record = book.find(name)
+    if record is None:
+        return CONTACT_NOT_FOUND
 
     if not record.phones:
         return f"No phones for {name}."
 
-    phones_str = '; '.join(p.value for p in record.phones)
+    phones_str = '; '.join(record.phones)
     return f"Contact name: {name}, phones: {phones_str}"
 
 
@@ -343,31 +625,47 @@ def show_all(args, book, view):
 
 @input_error
 def delete_contact(args, book, view):
-    name, *_ = args
+    if not args:
+        return NOT_ENOUGH_ARGS
+    name = args[0]
+    if book.find(name) is None:
+        return CONTACT_NOT_FOUND
     book.delete(name)
     return f"Contact {name} deleted."
 
 
 @input_error
 def remove_phone(args, book, view):
-    name, phone = args
+    if len(args) < 2:
+        return NOT_ENOUGH_ARGS
+    name, phone = args[0], args[1]
     record = book.find(name)
+    if record is None:
+        return CONTACT_NOT_FOUND
     record.remove_phone(phone)
     return f"Phone {phone} removed from {name}."
 
 
 @input_error
 def add_birthday(args, book, view):
-    name, birthday = args
+    if len(args) < 2:
+        return NOT_ENOUGH_ARGS
+    name, birthday = args[0], args[1]
     record = book.find(name)
-    record.add_birthday(birthday)
+    if record is None:
+        return CONTACT_NOT_FOUND
+    book.add_birthday(record, birthday)
     return f"Birthday added for {name}."
 
 
 @input_error
 def show_birthday(args, book, view):
-    name, *_ = args
+    if not args:
+        return NOT_ENOUGH_ARGS
+    name = args[0]
     record = book.find(name)
+    if record is None:
+        return CONTACT_NOT_FOUND
 
     if record.birthday:
         return f"{name}'s birthday: {record.birthday}"
@@ -382,6 +680,41 @@ def birthdays(args, book, view):
     return None  # View already handled the output
 
 
+def greet(book, view):
+    view.show_message("How can I help you?")
+
+
+def show_help(book, view):
+    view.show_commands()
+
+
+def exit_bot(book, view):
+    save_data(book)
+    view.show_goodbye()
+    return True  # Сигнал завершити головний цикл
+
+
+# ==================== Command Dispatch ====================
+COMMANDS = {
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+    "delete": delete_contact,
+    "remove": remove_phone,
+}
+
+META = {
+    "hello": greet,
+    "help": show_help,
+    "close": exit_bot,
+    "exit": exit_bot,
+}
+
+
 # ==================== Main Application ====================
 def main():
     # Ініціалізація view та завантаження даних
@@ -395,49 +728,21 @@ def main():
         user_input = view.get_input()
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
-            save_data(book)
-            view.show_goodbye()
-            break
-        elif command == "hello":
-            view.show_message("How can I help you?")
-        elif command == "help":
-            view.show_commands()
-        elif command == "add":
-            result = add_contact(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "change":
-            result = change_contact(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "phone":
-            result = show_phone(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "all":
-            show_all(args, book, view)
-        elif command == "add-birthday":
-            result = add_birthday(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "show-birthday":
-            result = show_birthday(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "birthdays":
-            birthdays(args, book, view)
-        elif command == "delete":
-            result = delete_contact(args, book, view)
-            if result:
-                view.show_message(result)
-        elif command == "remove":
-            result = remove_phone(args, book, view)
-            if result:
-                view.show_message(result)
-        else:
+        meta = META.get(command)
+        if meta is not None:
+            if meta(book, view):
+                break
+            continue
+
+        handler = COMMANDS.get(command)
+        if handler is None:
             view.show_message("Invalid command. Type 'help' to see available commands.")
+            continue
+
+        result = handler(args, book, view)
+        if result:
+            view.show_message(result)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()